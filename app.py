@@ -1,20 +1,32 @@
 """
 Main Flask Application for DQ Dashboard
 """
-from flask import Flask, render_template, request, jsonify, send_file
+from flask import Flask, Response, g, render_template, request, jsonify, send_file
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
+import orjson
+from sqlalchemy import case, create_engine, func, select
+from sqlalchemy.orm import scoped_session, sessionmaker
 import pandas as pd
 import os
+import time
+import queue
+import atexit
+import hashlib
+import functools
+import multiprocessing
+import threading
+import traceback
+from cachetools import TTLCache
 from io import BytesIO
-from reportlab.lib.pagesizes import letter, A4
-from reportlab.lib import colors
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak
-from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
-from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime, timezone
+
+try:
+    import fcntl
+except ImportError:  # Windows: only the single-process dev server is supported
+    fcntl = None
 
 from config.settings import DATABASE_URL, DEBUG_MODE, SECRET_KEY, UPLOAD_FOLDER
 from src.models.database_models import (
@@ -22,28 +34,181 @@ from src.models.database_models import (
 )
 from src.services.dq_analyzer import DataQualityAnalyzer
 from src.services.llm_service import LLMService
+from src.services.llm_cache import create_llm_cache, semantic_key
 from src.utils.db_init import initialize_app_database
+from src.utils.csv_reader import read_csv
+from src.utils.pdf_report import build_pdf_bytes
+
+class ORJSONProvider(DefaultJSONProvider):
+    """JSON provider backed by orjson; handles numpy scalars natively"""
+    
+    # Sorted keys keep responses identical to Flask's default provider, and
+    # datetimes still go through its default hook (RFC 822 strings)
+    options = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS | orjson.OPT_SORT_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+    
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=self.default, option=self.options).decode('utf-8')
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+    
+    def response(self, *args, **kwargs):
+        # Same argument rules as jsonify(); writes orjson's bytes straight into the response
+        if args and kwargs:
+            raise TypeError("jsonify() behavior undefined when passed both args and kwargs")
+        obj = args[0] if len(args) == 1 else (args or kwargs or None)
+        body = orjson.dumps(obj, default=self.default, option=self.options)
+        return self._app.response_class(body, mimetype=self.mimetype)
+
 
 # Create Flask app
 app = Flask(__name__)
+app.json = ORJSONProvider(app)
 app.config['SECRET_KEY'] = SECRET_KEY
 app.config['UPLOAD_FOLDER'] = UPLOAD_FOLDER
 app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max file size
 
 CORS(app)
 
-# Database setup
-engine = create_engine(DATABASE_URL)
-Session = sessionmaker(bind=engine)
+# Database setup (pooled engine, one session per request)
+engine_options = {'pool_size': 10, 'max_overflow': 20, 'pool_pre_ping': True}
+if DATABASE_URL.startswith('sqlite'):
+    engine_options['connect_args'] = {'check_same_thread': False}
+engine = create_engine(DATABASE_URL, **engine_options)
+Session = scoped_session(sessionmaker(bind=engine))
+
+# Source tables available for analysis
+TABLE_MODELS = {
+    'employees': Employee,
+    'payroll': Payroll,
+    'invoices': Invoice,
+    'expenses': Expense
+}
+
+# Row counts are polled by the dashboard, so keep them for a short while
+table_counts_cache = TTLCache(maxsize=1, ttl=30)
+table_counts_lock = threading.Lock()
+
+# Arrow-backed columns use less memory, but the analyzer expects numpy dtypes by default
+CSV_ARROW_DTYPES = os.getenv('CSV_ARROW_DTYPES', 'False').lower() == 'true'
 
 # Initialize services
 dq_analyzer = DataQualityAnalyzer()
 llm_service = LLMService()
+llm_cache = create_llm_cache()
+
+# Independent LLM calls within one request run side by side
+llm_executor = ThreadPoolExecutor(max_workers=8)
+
+# PDF rendering is CPU-bound and runs in a small process pool per gunicorn
+# worker, created on the first export. Render processes are spawned, never
+# forked from this multi-threaded process.
+PDF_POOL_WORKERS = int(os.getenv('PDF_POOL_WORKERS', 2))
+pdf_pool = None
+pdf_pool_lock = threading.Lock()
 
 # Ensure upload folder exists
 os.makedirs(UPLOAD_FOLDER, exist_ok=True)
 
 
+def initialize_database_once():
+    """Initialize the database on first run, holding a file lock across workers"""
+    # Server databases (e.g. Postgres) are provisioned separately or via /admin/init-db
+    if not DATABASE_URL.startswith('sqlite'):
+        return
+    
+    db_path = DATABASE_URL.replace('sqlite:///', '')
+    # The DB file appears before seeding finishes, so completion is tracked separately
+    marker_path = f"{db_path}.initialized"
+    
+    os.makedirs(os.path.dirname(db_path) or '.', exist_ok=True)
+    with open(f"{db_path}.init.lock", 'w') as lock_file:
+        if fcntl:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+        if os.path.exists(marker_path):
+            return
+        
+        # Databases created before the marker existed are already seeded
+        if not os.path.exists(db_path):
+            print("Initializing database for first time...")
+            initialize_app_database()
+        open(marker_path, 'w').close()
+
+
+# Every gunicorn worker imports this module, so first-run setup happens here
+with app.app_context():
+    initialize_database_once()
+
+
+@app.before_request
+def set_request_time():
+    """Take one UTC timestamp per request for handlers to share"""
+    # Timezone-aware, so the ISO strings sent to clients carry their +00:00 offset
+    g.now = datetime.now(timezone.utc)
+
+
+@app.teardown_appcontext
+def remove_session(exception=None):
+    """Return the request-local DB session to the pool"""
+    Session.remove()
+
+
+def get_table_counts():
+    """Get row counts for all source tables in a single query (cached 30s)"""
+    with table_counts_lock:
+        counts = table_counts_cache.get('counts')
+        if counts is None:
+            row = Session().execute(select(*(
+                select(func.count()).select_from(model).scalar_subquery()
+                for model in TABLE_MODELS.values()
+            ))).one()
+            counts = dict(zip(TABLE_MODELS.keys(), row))
+            table_counts_cache['counts'] = counts
+    return counts
+
+
+def body_etag(body):
+    """Short content hash of a response body, used as its ETag"""
+    return hashlib.blake2b(body, digest_size=8).hexdigest()
+
+
+def etagged(view):
+    """Tag successful responses of polled endpoints with a weak ETag; unchanged bodies get a 304"""
+    @functools.wraps(view)
+    def wrapper(*args, **kwargs):
+        response = app.make_response(view(*args, **kwargs))
+        if response.status_code == 200:
+            # Views serving static bodies set their precomputed ETag themselves
+            if 'ETag' not in response.headers:
+                response.set_etag(body_etag(response.get_data()), weak=True)
+            response.cache_control.max_age = 30
+            response = response.make_conditional(request)
+        return response
+    return wrapper
+
+
+def render_pdf(analysis, entity_name):
+    """Render a PDF report in the process pool, replacing the pool if it broke"""
+    global pdf_pool
+    with pdf_pool_lock:
+        if pdf_pool is None:
+            pdf_pool = ProcessPoolExecutor(
+                max_workers=PDF_POOL_WORKERS,
+                mp_context=multiprocessing.get_context('spawn')
+            )
+        pool = pdf_pool
+    
+    try:
+        return pool.submit(build_pdf_bytes, analysis, entity_name).result()
+    except BrokenProcessPool:
+        # A render process died; start a fresh pool for the next export
+        with pdf_pool_lock:
+            if pdf_pool is pool:
+                pdf_pool = None
+        pool.shutdown(wait=False)
+        raise
+
+
 @app.route('/')
 def index():
     """Main dashboard page"""
@@ -53,17 +218,13 @@ def index():
 @app.route('/api/domains', methods=['GET'])
 def get_domains():
     """Get all domains"""
-    session = Session()
-    try:
-        domains = session.query(Domain).all()
-        result = [{
-            'id': d.id,
-            'name': d.name,
-            'description': d.description
-        } for d in domains]
-        return jsonify({'success': True, 'domains': result})
-    finally:
-        session.close()
+    domains = Session().query(Domain).all()
+    result = [{
+        'id': d.id,
+        'name': d.name,
+        'description': d.description
+    } for d in domains]
+    return jsonify({'success': True, 'domains': result})
 
 
 @app.route('/api/analyze/table/<table_name>', methods=['POST'])
@@ -71,22 +232,11 @@ def analyze_table(table_name):
     """Analyze a specific table from database"""
     session = Session()
     try:
-        # Map table names to models
-        table_map = {
-            'employees': Employee,
-            'payroll': Payroll,
-            'invoices': Invoice,
-            'expenses': Expense
-        }
-        
-        if table_name not in table_map:
+        if table_name not in TABLE_MODELS:
             return jsonify({'success': False, 'error': 'Invalid table name'}), 400
         
-        # Query data
-        model = table_map[table_name]
-        data = session.query(model).all()
-        
-        if not data:
+        model = TABLE_MODELS[table_name]
+        if not session.query(session.query(model.id).exists()).scalar():
             return jsonify({'success': False, 'error': 'No data found'}), 404
         
         # Convert to DataFrame
@@ -95,14 +245,17 @@ def analyze_table(table_name):
         # Analyze data quality
         analysis = dq_analyzer.analyze_dataframe(df, table_name)
         
+        # Give the connection back to the pool before the slow LLM call
+        Session.remove()
+        
         # Always generate AI insights
         try:
-            llm_result = llm_service.analyze_table_quality({
+            llm_result = llm_cache.call(llm_service.analyze_table_quality, {
                 'table_name': table_name,
                 'domain': 'HR/Finance',
                 **analysis['table_scores'],
                 'issues': analysis['issues']
-            })
+            }, semantic_text=semantic_key(table_name, 'HR/Finance', analysis['issues'], analysis['table_scores']))
             analysis['ai_insights'] = llm_result
         except Exception as llm_error:
             print(f"LLM Error: {llm_error}")
@@ -117,11 +270,8 @@ def analyze_table(table_name):
         })
         
     except Exception as e:
-        import traceback
         traceback.print_exc()  # Print full error to console
         return jsonify({'success': False, 'error': str(e)}), 500
-    finally:
-        session.close()
 
 
 @app.route('/api/analyze/csv', methods=['POST'])
@@ -140,14 +290,21 @@ def analyze_csv():
     
     try:
         # Read CSV
-        df = pd.read_csv(file)
+        df = read_csv(file.stream, arrow_dtypes=CSV_ARROW_DTYPES)
         
         # Analyze data quality
         analysis = dq_analyzer.analyze_dataframe(df, file.filename)
         
+        # Rules only depend on the detected issues, so generate them while
+        # the domain and insights calls run; the frontend reuses them as-is
+        rules_future = llm_executor.submit(
+            llm_cache.call, llm_service.generate_rules_from_issues,
+            analysis['issues'], analysis.get('field_analyses', [])
+        )
+        
         # Detect domain via LLM (single word)
         try:
-            detected_domain = llm_service.detect_domain_single_word(df.columns.tolist(), file.filename)
+            detected_domain = llm_cache.call(llm_service.detect_domain_single_word, df.columns.tolist(), file.filename)
             analysis['detected_domain'] = detected_domain
         except Exception as domain_error:
             print(f"Domain Detection Error: {domain_error}")
@@ -155,12 +312,13 @@ def analyze_csv():
         
         # Always generate AI insights
         try:
-            llm_result = llm_service.analyze_table_quality({
+            domain = analysis.get('detected_domain', 'Uploaded Data')
+            llm_result = llm_cache.call(llm_service.analyze_table_quality, {
                 'table_name': file.filename,
-                'domain': analysis.get('detected_domain', 'Uploaded Data'),
+                'domain': domain,
                 **analysis['table_scores'],
                 'issues': analysis['issues']
-            })
+            }, semantic_text=semantic_key(file.filename, domain, analysis['issues'], analysis['table_scores']))
             analysis['ai_insights'] = llm_result
         except Exception as llm_error:
             print(f"LLM Error: {llm_error}")
@@ -169,6 +327,12 @@ def analyze_csv():
                 'error': str(llm_error)
             }
         
+        try:
+            analysis['rules'] = rules_future.result()
+        except Exception as rules_error:
+            print(f"Rules Generation Error: {rules_error}")
+            analysis['rules'] = []
+        
         return jsonify({
             'success': True,
             'analysis': analysis
@@ -186,7 +350,7 @@ def detect_domain():
     filename = data.get('filename', '')
     
     try:
-        domain = llm_service.detect_domain_single_word(columns, filename)
+        domain = llm_cache.call(llm_service.detect_domain_single_word, columns, filename)
         return jsonify({
             'success': True,
             'domain': domain
@@ -196,36 +360,29 @@ def detect_domain():
 
 
 @app.route('/api/domains/from-database', methods=['GET'])
+@etagged
 def get_domains_from_database():
     """Get domains based on database tables"""
-    session = Session()
-    try:
-        domains = []
-        
-        # Check which tables have data
-        if session.query(Employee).count() > 0:
-            domains.append({'name': 'HR', 'source': 'employees'})
-        if session.query(Payroll).count() > 0:
-            domains.append({'name': 'Payroll', 'source': 'payroll'})
-        if session.query(Invoice).count() > 0:
-            domains.append({'name': 'Finance', 'source': 'invoices'})
-        if session.query(Expense).count() > 0:
-            domains.append({'name': 'Expenses', 'source': 'expenses'})
-        
-        # Default if no data
-        if not domains:
-            domains = [
-                {'name': 'HR', 'source': 'default'},
-                {'name': 'Finance', 'source': 'default'}
-            ]
-        
-        return jsonify({
-            'success': True,
-            'domains': domains,
-            'source': 'database'
-        })
-    finally:
-        session.close()
+    table_domains = {'employees': 'HR', 'payroll': 'Payroll', 'invoices': 'Finance', 'expenses': 'Expenses'}
+    
+    # Check which tables have data
+    domains = [
+        {'name': table_domains[table], 'source': table}
+        for table, count in get_table_counts().items() if count > 0
+    ]
+    
+    # Default if no data
+    if not domains:
+        domains = [
+            {'name': 'HR', 'source': 'default'},
+            {'name': 'Finance', 'source': 'default'}
+        ]
+    
+    return jsonify({
+        'success': True,
+        'domains': domains,
+        'source': 'database'
+    })
 
 
 @app.route('/api/generate-rules-from-issues', methods=['POST'])
@@ -236,7 +393,7 @@ def generate_rules_from_issues():
     field_analyses = data.get('field_analyses', [])
     
     try:
-        rules = llm_service.generate_rules_from_issues(issues, field_analyses)
+        rules = llm_cache.call(llm_service.generate_rules_from_issues, issues, field_analyses)
         return jsonify({
             'success': True,
             'rules': rules
@@ -245,6 +402,11 @@ def generate_rules_from_issues():
         return jsonify({'success': False, 'error': str(e)}), 500
 
 
+# Critical findings are ranked by position; everything after these is Medium
+FINDING_PRIORITIES = ('Immediate', 'Immediate', 'High', 'High')
+ACTION_PRIORITIES = {'critical': 'Immediate', 'high': 'High', 'medium': 'Medium', 'low': 'Low'}
+
+
 @app.route('/api/generate-detailed-issue-analysis', methods=['POST'])
 def generate_detailed_issue_analysis():
     """Generate detailed AI analysis with Critical Findings and Recommended Actions"""
@@ -254,7 +416,7 @@ def generate_detailed_issue_analysis():
     domain = data.get('domain', 'Data')
     
     try:
-        result = llm_service.generate_detailed_issue_analyses(issues, field_analyses, domain)
+        result = llm_cache.call(llm_service.generate_detailed_issue_analyses, issues, field_analyses, domain)
         
         # Convert to frontend-expected format
         structured_analysis = {
@@ -265,27 +427,22 @@ def generate_detailed_issue_analysis():
         
         # Format critical findings with priority
         for i, finding in enumerate(result.get('critical_findings', [])):
-            # Determine priority based on position and content
-            priority = 'Immediate' if i < 2 else ('High' if i < 4 else 'Medium')
+            text = str(finding)
             
-            # Extract field name if present
-            field = 'General'
-            if ':' in str(finding):
-                parts = str(finding).split(':')
-                field = parts[0].strip()
+            # Extract field name if present ("field: finding")
+            head, sep, _ = text.partition(':')
             
             structured_analysis['critical_findings'].append({
-                'field': field,
-                'finding': str(finding),
-                'priority': priority,
+                'field': head.strip() if sep else 'General',
+                'finding': text,
+                'priority': FINDING_PRIORITIES[i] if i < len(FINDING_PRIORITIES) else 'Medium',
                 'impact': 'Data quality and downstream processes affected'
             })
         
         # Format recommended actions
         for action_item in result.get('recommended_actions', []):
             if isinstance(action_item, dict):
-                priority_map = {'critical': 'Immediate', 'high': 'High', 'medium': 'Medium', 'low': 'Low'}
-                priority = priority_map.get(action_item.get('priority', 'medium'), 'Medium')
+                priority = ACTION_PRIORITIES.get(action_item.get('priority', 'medium'), 'Medium')
                 
                 structured_analysis['recommended_actions'].append({
                     'action': action_item.get('action', ''),
@@ -305,7 +462,6 @@ def generate_detailed_issue_analysis():
             'issue_analyses': result.get('critical_findings', [])  # Backward compatibility
         })
     except Exception as e:
-        import traceback
         traceback.print_exc()
         return jsonify({'success': False, 'error': str(e)}), 500
 
@@ -318,7 +474,10 @@ def generate_ai_rules_summary():
     domain = data.get('domain', 'Data')
     
     try:
-        summary = llm_service.generate_crisp_summary(issues, domain)
+        summary = llm_cache.call(
+            llm_service.generate_crisp_summary, issues, domain,
+            semantic_text=semantic_key('', domain, issues)
+        )
         return jsonify({
             'success': True,
             'summary': summary
@@ -337,7 +496,7 @@ def analyze_field():
     
     try:
         # Generate AI insights for field
-        llm_result = llm_service.analyze_field_quality(data['field_stats'])
+        llm_result = llm_cache.call(llm_service.analyze_field_quality, data['field_stats'])
         
         return jsonify({
             'success': True,
@@ -362,7 +521,7 @@ def review_insight(insight_id):
         insight.is_reviewed = True
         insight.is_approved = data.get('approved', False)
         insight.reviewed_by = data.get('reviewer', 'Admin')
-        insight.reviewed_at = pd.Timestamp.now()
+        insight.reviewed_at = g.now
         
         session.commit()
         
@@ -374,29 +533,24 @@ def review_insight(insight_id):
     except Exception as e:
         session.rollback()
         return jsonify({'success': False, 'error': str(e)}), 500
-    finally:
-        session.close()
 
 
 @app.route('/api/stats/overall', methods=['GET'])
+@etagged
 def get_overall_stats():
     """Get overall statistics for dashboard"""
-    session = Session()
-    try:
-        stats = {
-            'total_employees': session.query(Employee).count(),
-            'total_invoices': session.query(Invoice).count(),
-            'total_expenses': session.query(Expense).count(),
-            'total_payroll_records': session.query(Payroll).count()
-        }
-        
-        return jsonify({
-            'success': True,
-            'stats': stats
-        })
-        
-    finally:
-        session.close()
+    counts = get_table_counts()
+    stats = {
+        'total_employees': counts['employees'],
+        'total_invoices': counts['invoices'],
+        'total_expenses': counts['expenses'],
+        'total_payroll_records': counts['payroll']
+    }
+    
+    return jsonify({
+        'success': True,
+        'stats': stats
+    })
 
 
 @app.route('/api/stats/dashboard-overview', methods=['GET'])
@@ -413,30 +567,19 @@ def get_dashboard_overview():
             'data_tables': 4,  # employees, payroll, invoices, expenses
             'avg_quality': 0,
             'issues_found': 0,
-            'last_updated': datetime.now().isoformat()
+            'last_updated': g.now.isoformat()
         }
         
         # Calculate aggregate stats from all tables
-        table_counts = {
-            'employees': session.query(Employee).count(),
-            'payroll': session.query(Payroll).count(),
-            'invoices': session.query(Invoice).count(),
-            'expenses': session.query(Expense).count()
-        }
-        
-        overview['total_records'] = sum(table_counts.values())
-        
-        # Get DQ scores if available
-        scores = session.query(DQScore).all()
-        if scores:
-            avg_quality = sum(s.overall_score for s in scores) / len(scores) if scores else 0
-            overview['avg_quality'] = round(avg_quality, 1)
-            
-            # Count issues based on quality grades
-            issue_count = len([s for s in scores if s.quality_grade in ['C', 'D']])
-            overview['issues_found'] = issue_count
+        overview['total_records'] = sum(get_table_counts().values())
         
-        session.close()
+        # Aggregate DQ scores in SQL; issues are scores graded C or D
+        avg_quality, issue_count = session.query(
+            func.avg(DQScore.overall_score),
+            func.sum(case((DQScore.quality_grade.in_(['C', 'D']), 1), else_=0))
+        ).one()
+        overview['avg_quality'] = round(avg_quality or 0, 1)
+        overview['issues_found'] = int(issue_count or 0)
         
         return jsonify({
             'success': True,
@@ -455,144 +598,17 @@ def export_analysis_pdf():
         analysis = data.get('analysis', {})
         entity_name = data.get('entity_name', 'Analysis Report')
         
-        # Create PDF
-        buffer = BytesIO()
-        doc = SimpleDocTemplate(buffer, pagesize=letter, topMargin=0.5*inch, bottomMargin=0.5*inch)
-        elements = []
-        
-        styles = getSampleStyleSheet()
-        title_style = ParagraphStyle(
-            'CustomTitle',
-            parent=styles['Heading1'],
-            fontSize=24,
-            textColor=colors.HexColor('#6366f1'),
-            spaceAfter=6,
-            alignment=TA_CENTER,
-            fontName='Helvetica-Bold'
-        )
-        heading_style = ParagraphStyle(
-            'CustomHeading',
-            parent=styles['Heading2'],
-            fontSize=14,
-            textColor=colors.HexColor('#1e293b'),
-            spaceAfter=12,
-            spaceBefore=12,
-            fontName='Helvetica-Bold'
-        )
-        
-        # Title
-        elements.append(Paragraph(entity_name, title_style))
-        elements.append(Spacer(1, 0.2*inch))
-        
-        # Report Info
-        report_date = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        elements.append(Paragraph(f"<b>Report Generated:</b> {report_date}", styles['Normal']))
-        elements.append(Spacer(1, 0.2*inch))
-        
-        # Quality Scores Summary
-        elements.append(Paragraph("Quality Scores", heading_style))
-        
-        table_scores = analysis.get('table_scores', {})
-        scores_data = [
-            ['Metric', 'Score', 'Status'],
-            ['Completeness', f"{table_scores.get('completeness_score', 0):.1f}%", '✓'],
-            ['Correctness', f"{table_scores.get('correctness_score', 0):.1f}%", '✓'],
-            ['Uniqueness', f"{table_scores.get('uniqueness_score', 0):.1f}%", '✓'],
-            ['Consistency', f"{table_scores.get('consistency_score', 0):.1f}%", '✓'],
-            ['Overall Score', f"{table_scores.get('overall_score', 0):.1f}%", table_scores.get('quality_grade', 'N/A')]
-        ]
-        
-        scores_table = Table(scores_data, colWidths=[2.5*inch, 2*inch, 1.5*inch])
-        scores_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#6366f1')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 12),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black),
-            ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-            ('FONTSIZE', (0, 1), (-1, -1), 10),
-            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f0f0f0')])
-        ]))
-        
-        elements.append(scores_table)
-        elements.append(Spacer(1, 0.3*inch))
-        
-        # Field Analysis
-        elements.append(Paragraph("Field-Level Analysis", heading_style))
-        
-        field_analyses = analysis.get('field_analyses', [])
-        if field_analyses:
-            field_data = [['Field Name', 'Data Type', 'Completeness', 'Correctness', 'Overall Score', 'Grade']]
-            for field in field_analyses:
-                field_data.append([
-                    field.get('field_name', ''),
-                    field.get('data_type', ''),
-                    f"{field.get('completeness_score', 0):.1f}%",
-                    f"{field.get('correctness_score', 0):.1f}%",
-                    f"{field.get('overall_score', 0):.1f}%",
-                    field.get('quality_grade', '')
-                ])
-            
-            field_table = Table(field_data, colWidths=[1.5*inch, 1*inch, 1*inch, 1*inch, 1*inch, 0.8*inch])
-            field_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#6366f1')),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, 0), 10),
-                ('BOTTOMPADDING', (0, 0), (-1, 0), 8),
-                ('GRID', (0, 0), (-1, -1), 1, colors.black),
-                ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-                ('FONTSIZE', (0, 1), (-1, -1), 9),
-                ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f8f8f8')])
-            ]))
-            elements.append(field_table)
-            elements.append(Spacer(1, 0.3*inch))
-        
-        # Issues Section
-        issues = analysis.get('issues', [])
-        if issues:
-            elements.append(Paragraph("Detected Issues", heading_style))
-            issues_data = [['Type', 'Severity', 'Description', 'Field']]
-            for issue in issues:
-                issues_data.append([
-                    issue.get('type', ''),
-                    issue.get('severity', ''),
-                    issue.get('description', '')[:50],
-                    issue.get('field', '-')
-                ])
-            
-            issues_table = Table(issues_data, colWidths=[1*inch, 1*inch, 3*inch, 1.5*inch])
-            issues_table.setStyle(TableStyle([
-                ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#ef4444')),
-                ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-                ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-                ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-                ('FONTSIZE', (0, 0), (-1, 0), 10),
-                ('BOTTOMPADDING', (0, 0), (-1, 0), 8),
-                ('GRID', (0, 0), (-1, -1), 1, colors.black),
-                ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
-                ('FONTSIZE', (0, 1), (-1, -1), 9),
-                ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#fff5f5')])
-            ]))
-            elements.append(issues_table)
-        
-        # Build PDF
-        doc.build(elements)
-        buffer.seek(0)
+        # Render in a worker process so this request thread stays free
+        pdf_bytes = render_pdf(analysis, entity_name)
         
         return send_file(
-            buffer,
+            BytesIO(pdf_bytes),
             mimetype='application/pdf',
             as_attachment=True,
             download_name=f'analysis_{datetime.now().strftime("%Y%m%d_%H%M%S")}.pdf'
         )
         
     except Exception as e:
-        import traceback
         traceback.print_exc()
         return jsonify({'success': False, 'error': str(e)}), 500
 
@@ -609,62 +625,82 @@ def test_llm_connection():
     })
 
 
-@app.route('/api/domain/summary', methods=['GET'])
-def get_domain_summary():
-    """Get domain and sub-domain hierarchy with scores"""
-    session = Session()
-    try:
-        # Mock data structure matching the UI requirements
-        domain_summary = {
-            'HR': {
-                'score': 37,
-                'owner': 'HR Ops',
-                'criticality': 'High',
-                'description': 'Employee master, payroll, and organization structure',
-                'sub_domains': {
-                    'Core HR': {
-                        'score': 90,
-                        'description': 'Employee demographic and master data',
-                        'tables': ['Employees Master']
-                    },
-                    'Payroll': {
-                        'score': 82,
-                        'description': 'Salary, payslips, and deductions',
-                        'tables': ['Payroll', 'Tax Deductions']
-                    }
-                }
+@app.route('/api/llm/cache-stats', methods=['GET', 'POST'])
+def get_llm_cache_stats():
+    """Get LLM response cache statistics; POST tunes the semantic threshold"""
+    # The LLM cache is per process, so POST only retunes the worker that serves it
+    # (reported as worker_pid); use LLM_SEMANTIC_CACHE_THRESHOLD to set it everywhere
+    if request.method == 'POST':
+        data = request.json or {}
+        if llm_cache.semantic is None:
+            return jsonify({'success': False, 'error': 'Semantic cache is not enabled'}), 400
+        try:
+            llm_cache.semantic.set_threshold(float(data.get('semantic_threshold')))
+        except (TypeError, ValueError) as e:
+            return jsonify({'success': False, 'error': str(e)}), 400
+
+    return jsonify({
+        'success': True,
+        'worker_pid': os.getpid(),
+        'stats': llm_cache.get_stats()
+    })
+
+
+# Mock data structure matching the UI requirements
+DOMAIN_SUMMARY = {
+    'HR': {
+        'score': 37,
+        'owner': 'HR Ops',
+        'criticality': 'High',
+        'description': 'Employee master, payroll, and organization structure',
+        'sub_domains': {
+            'Core HR': {
+                'score': 90,
+                'description': 'Employee demographic and master data',
+                'tables': ['Employees Master']
+            },
+            'Payroll': {
+                'score': 82,
+                'description': 'Salary, payslips, and deductions',
+                'tables': ['Payroll', 'Tax Deductions']
+            }
+        }
+    },
+    'Finance': {
+        'score': 80,
+        'owner': 'Finance CoE',
+        'criticality': 'High',
+        'description': 'Financial transactions, accounting and spend analytics',
+        'sub_domains': {
+            'Accounts Receivable': {
+                'score': 78,
+                'description': 'Customer invoices and collections',
+                'tables': ['Invoices']
             },
-            'Finance': {
+            'Accounts Payable': {
+                'score': 84,
+                'description': 'Vendor invoices and expenses',
+                'tables': ['Collections']
+            },
+            'Expenses': {
                 'score': 80,
-                'owner': 'Finance CoE',
-                'criticality': 'High',
-                'description': 'Financial transactions, accounting and spend analytics',
-                'sub_domains': {
-                    'Accounts Receivable': {
-                        'score': 78,
-                        'description': 'Customer invoices and collections',
-                        'tables': ['Invoices']
-                    },
-                    'Accounts Payable': {
-                        'score': 84,
-                        'description': 'Vendor invoices and expenses',
-                        'tables': ['Collections']
-                    },
-                    'Expenses': {
-                        'score': 80,
-                        'description': 'Expense tracking and vendor payments',
-                        'tables': ['Vendor Payments']
-                    }
-                }
+                'description': 'Expense tracking and vendor payments',
+                'tables': ['Vendor Payments']
             }
         }
-        
-        return jsonify({
-            'success': True,
-            'domains': domain_summary
-        })
-    finally:
-        session.close()
+    }
+}
+DOMAIN_SUMMARY_BODY = orjson.dumps({'success': True, 'domains': DOMAIN_SUMMARY}, option=orjson.OPT_SORT_KEYS)
+DOMAIN_SUMMARY_ETAG = body_etag(DOMAIN_SUMMARY_BODY)
+
+
+@app.route('/api/domain/summary', methods=['GET'])
+@etagged
+def get_domain_summary():
+    """Get domain and sub-domain hierarchy with scores"""
+    response = Response(DOMAIN_SUMMARY_BODY, mimetype='application/json')
+    response.set_etag(DOMAIN_SUMMARY_ETAG, weak=True)
+    return response
 
 
 @app.route('/api/subdomain/ai-summary', methods=['POST'])
@@ -692,7 +728,7 @@ def get_subdomain_ai_summary():
         """
         
         # Use LLM service to generate insights
-        summary = llm_service.generate_subdomain_summary(context, sub_domain, score)
+        summary = llm_cache.call(llm_service.generate_subdomain_summary, context, sub_domain, score)
         
         return jsonify({
             'success': True,
@@ -709,9 +745,74 @@ def get_subdomain_ai_summary():
         }), 500
 
 
+# Edited summaries are queued and committed in batches by a background writer
+insight_queue = queue.Queue()
+INSIGHT_BATCH_SIZE = 100
+INSIGHT_FLUSH_INTERVAL = 0.5  # seconds
+INSIGHT_WRITER_STOP = object()  # queued at exit, after all pending insights
+
+
+def write_insights(insights):
+    """Commit a batch of DQInsight rows, falling back to row-by-row on failure"""
+    session = Session()
+    try:
+        session.bulk_save_objects(insights)
+        session.commit()
+    except Exception as e:
+        session.rollback()
+        print(f"Batch insight write failed, retrying row by row: {e}")
+        
+        # These were already acknowledged to clients, so keep every row we can
+        for insight in insights:
+            try:
+                session.add(insight)
+                session.commit()
+            except Exception as e:
+                session.rollback()
+                print(f"Failed to save insight for '{insight.entity_name}': {e}")
+    finally:
+        Session.remove()
+
+
+def flush_insights():
+    """Background writer: flush queued insights every 500ms or every batch"""
+    while True:
+        item = insight_queue.get()
+        if item is INSIGHT_WRITER_STOP:
+            return
+        
+        batch = [item]
+        stopping = False
+        deadline = time.monotonic() + INSIGHT_FLUSH_INTERVAL
+        while len(batch) < INSIGHT_BATCH_SIZE:
+            try:
+                item = insight_queue.get(timeout=max(deadline - time.monotonic(), 0))
+            except queue.Empty:
+                break
+            if item is INSIGHT_WRITER_STOP:
+                stopping = True
+                break
+            batch.append(item)
+        
+        write_insights(batch)
+        if stopping:
+            return
+
+
+insight_writer = threading.Thread(target=flush_insights, name='insight-writer', daemon=True)
+insight_writer.start()
+
+
+@atexit.register
+def stop_insight_writer():
+    """Let the writer flush everything still queued, then wait for it"""
+    insight_queue.put(INSIGHT_WRITER_STOP)
+    insight_writer.join()
+
+
 @app.route('/api/subdomain/save-summary', methods=['POST'])
 def save_subdomain_summary():
-    """Save edited AI summary for sub-domain"""
+    """Save edited AI summary for sub-domain (queued; ?sync=true commits immediately)"""
     session = Session()
     try:
         data = request.json
@@ -731,17 +832,26 @@ def save_subdomain_summary():
             is_reviewed=True,
             is_approved=True,
             reviewed_by=edited_by,
-            reviewed_at=datetime.utcnow()
+            reviewed_at=g.now
         )
         
-        session.add(insight)
-        session.commit()
+        if request.args.get('sync', 'false').lower() == 'true':
+            session.add(insight)
+            session.commit()
+            
+            return jsonify({
+                'success': True,
+                'message': 'Summary saved successfully',
+                'timestamp': g.now.isoformat()
+            })
+        
+        insight_queue.put(insight)
         
         return jsonify({
             'success': True,
-            'message': 'Summary saved successfully',
-            'timestamp': datetime.utcnow().isoformat()
-        })
+            'message': 'Summary queued for saving',
+            'timestamp': g.now.isoformat()
+        }), 202
         
     except Exception as e:
         session.rollback()
@@ -749,30 +859,24 @@ def save_subdomain_summary():
             'success': False,
             'error': str(e)
         }), 500
-    finally:
-        session.close()
+
+
+DOMAIN_QUALITY_CHART = {
+    'labels': ['HR', 'Core HR', 'Payroll', 'Finance', 'Accounts\nReceivable', 'Accounts\nPayable', 'DQ.80%'],
+    'scores': [90, 90, 82, 80, 78, 64, 80],
+    'colors': ['#3b82f6', '#60a5fa', '#93c5fd', '#f59e0b', '#fbbf24', '#fcd34d', '#3b82f6']
+}
+DOMAIN_QUALITY_CHART_BODY = orjson.dumps({'success': True, 'data': DOMAIN_QUALITY_CHART}, option=orjson.OPT_SORT_KEYS)
+DOMAIN_QUALITY_CHART_ETAG = body_etag(DOMAIN_QUALITY_CHART_BODY)
 
 
 @app.route('/api/chart/domain-quality', methods=['GET'])
+@etagged
 def get_domain_quality_chart_data():
     """Get data for domain quality bar chart"""
-    try:
-        chart_data = {
-            'labels': ['HR', 'Core HR', 'Payroll', 'Finance', 'Accounts\nReceivable', 'Accounts\nPayable', 'DQ.80%'],
-            'scores': [90, 90, 82, 80, 78, 64, 80],
-            'colors': ['#3b82f6', '#60a5fa', '#93c5fd', '#f59e0b', '#fbbf24', '#fcd34d', '#3b82f6']
-        }
-        
-        return jsonify({
-            'success': True,
-            'data': chart_data
-        })
-        
-    except Exception as e:
-        return jsonify({
-            'success': False,
-            'error': str(e)
-        }), 500
+    response = Response(DOMAIN_QUALITY_CHART_BODY, mimetype='application/json')
+    response.set_etag(DOMAIN_QUALITY_CHART_ETAG, weak=True)
+    return response
 
 
 @app.route('/admin/init-db', methods=['POST'])
@@ -780,6 +884,7 @@ def init_database():
     """Admin endpoint to initialize/reset database"""
     try:
         initialize_app_database()
+        table_counts_cache.clear()
         return jsonify({
             'success': True,
             'message': 'Database initialized successfully'
@@ -802,17 +907,16 @@ def internal_error(error):
 
 
 if __name__ == '__main__':
-    # Initialize database on first run
-    if not os.path.exists(DATABASE_URL.replace('sqlite:///', '')):
-        print("Initializing database for first time...")
-        initialize_app_database()
-    
-    print("\n" + "="*60)
-    print("🚀 DQ Dashboard Server Starting...")
-    print("="*60)
-    print(f"📊 Dashboard: http://localhost:5000")
-    print(f"🤖 LLM Model: {llm_service.model}")
-    print(f"🔒 Guardrails: Enabled")
-    print("="*60 + "\n")
+    # Development server only; production runs under gunicorn (see Procfile)
+    rule = "=" * 60
+    print(
+        f"\n{rule}\n"
+        "🚀 DQ Dashboard Server Starting...\n"
+        f"{rule}\n"
+        "📊 Dashboard: http://localhost:5000\n"
+        f"🤖 LLM Model: {llm_service.model}\n"
+        "🔒 Guardrails: Enabled\n"
+        f"{rule}\n"
+    )
     
     app.run(debug=DEBUG_MODE, host='0.0.0.0', port=5000)
@@ -0,0 +1,17 @@
+"""
+Gunicorn configuration for DQ Dashboard
+
+Threaded workers let LLM and database I/O from concurrent analysis
+requests overlap. Start with the default (2 x CPU + 1 workers) and tune
+GUNICORN_WORKERS / GUNICORN_THREADS down if PDF export saturates the CPU.
+"""
+import multiprocessing
+import os
+
+bind = os.getenv('GUNICORN_BIND', '0.0.0.0:5000')
+workers = int(os.getenv('GUNICORN_WORKERS', multiprocessing.cpu_count() * 2 + 1))
+worker_class = 'gthread'
+threads = int(os.getenv('GUNICORN_THREADS', 4))
+
+# LLM calls can take tens of seconds
+timeout = int(os.getenv('GUNICORN_TIMEOUT', 120))
@@ -69,7 +69,13 @@ function showPage(pageName) {
     
     // When navigating to rules page, generate dynamic rules from detected issues
     if (pageName === 'rules' && window.currentIssues && window.currentIssues.length > 0) {
-        generateDynamicRules(window.currentIssues, window.currentFieldAnalyses);
+        // CSV analysis returns its rules up front, so skip the extra LLM request
+        if (window.currentRules && window.currentRules.length > 0) {
+            generatedRules = window.currentRules;
+            renderDynamicRules(window.currentRules);
+        } else {
+            generateDynamicRules(window.currentIssues, window.currentFieldAnalyses);
+        }
     }
     
     // Update nav link active state
@@ -515,6 +521,7 @@ async function analyzeCSV() {
             if (data.analysis.issues) {
                 window.currentIssues = data.analysis.issues;
                 window.currentFieldAnalyses = data.analysis.field_analyses;
+                window.currentRules = data.analysis.rules || null;
             }
             
             // Display AI insights if available
@@ -1060,6 +1067,7 @@ function resetToManualDomainSelection() {
     currentAnalysis = null;
     window.currentIssues = null;
     window.currentFieldAnalyses = null;
+    window.currentRules = null;
     
     // Clear generated rules
     generatedRules = [];
@@ -1245,6 +1253,7 @@ function analyzeCSVFile() {
             if (data.analysis.issues) {
                 window.currentIssues = data.analysis.issues;
                 window.currentFieldAnalyses = data.analysis.field_analyses;
+                window.currentRules = data.analysis.rules || null;
             }
             
             // Switch to analysis page FIRST before displaying results
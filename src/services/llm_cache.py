@@ -0,0 +1,329 @@
+"""
+LLM response cache for DQ Dashboard
+
+Exact-match cache for llm_service calls. Keys are a SHA-256 of the
+function name plus the normalized request payload, so identical inputs
+(same CSV, same columns, same issues) skip the LLM round-trip.
+
+An optional second tier (SemanticCache, enabled with LLM_SEMANTIC_CACHE=true)
+matches near-identical prompts by embedding similarity, e.g. re-analyzing a CSV whose issue distribution is
+the same but whose field names or counts differ slightly.
+"""
+import hashlib
+import json
+import numbers
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Protocol, Tuple
+
+from cachetools import LRUCache
+
+try:
+    import redis
+except ImportError:  # Redis backend is optional
+    redis = None
+
+try:
+    import faiss
+    import numpy as np
+    from sentence_transformers import SentenceTransformer
+except ImportError:  # Semantic cache is optional
+    faiss = None
+    SentenceTransformer = None
+
+
+DEFAULT_TTL = 3600  # seconds
+DEFAULT_MAXSIZE = 512
+
+SEMANTIC_MODEL_NAME = 'sentence-transformers/all-MiniLM-L6-v2'
+SEMANTIC_DEFAULT_THRESHOLD = 0.95
+SEMANTIC_THRESHOLD_RANGE = (0.92, 0.97)
+
+
+class CacheBackend(Protocol):
+    """Storage interface used by LLMCache"""
+
+    def get(self, key: str) -> Optional[Any]:
+        ...
+
+    def set(self, key: str, value: Any, ttl: int = DEFAULT_TTL) -> None:
+        ...
+
+    def clear(self) -> None:
+        ...
+
+
+class MemoryCacheBackend:
+    """In-process LRU cache with per-entry TTL"""
+
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE):
+        self._cache = LRUCache(maxsize=maxsize)
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._cache[key]
+                return None
+            return value
+
+    def set(self, key: str, value: Any, ttl: int = DEFAULT_TTL) -> None:
+        with self._lock:
+            self._cache[key] = (time.monotonic() + ttl, value)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+
+class RedisCacheBackend:
+    """Redis-backed cache, shared across worker processes"""
+
+    def __init__(self, url: str, prefix: str = 'llm:'):
+        if redis is None:
+            raise ImportError("The 'redis' package is required for RedisCacheBackend")
+        self._client = redis.Redis.from_url(url)
+        self._prefix = prefix
+
+    def get(self, key: str) -> Optional[Any]:
+        raw = self._client.get(self._prefix + key)
+        return json.loads(raw) if raw is not None else None
+
+    def set(self, key: str, value: Any, ttl: int = DEFAULT_TTL) -> None:
+        self._client.setex(self._prefix + key, ttl, json.dumps(value, default=str))
+
+    def clear(self) -> None:
+        for key in self._client.scan_iter(f"{self._prefix}*"):
+            self._client.delete(key)
+
+
+def semantic_key(table_name: str, domain: str, issues: List[Dict], scores: Dict = None) -> str:
+    """Normalized text describing an analysis, used as the semantic cache key"""
+    issue_types = sorted({str(issue.get('type', '')) for issue in issues or []})
+    fields = sorted({str(issue.get('field', '')) for issue in issues or [] if issue.get('field')})
+    key = (
+        f"table: {table_name} | domain: {domain} | "
+        f"issues: {' '.join(issue_types)} | fields: {' '.join(fields)}"
+    )
+    if scores:
+        # Scores rounded to 10 so insights quoting old scores aren't reused
+        # once a table's quality has really moved
+        buckets = sorted(
+            f"{name} {round(value, -1):.0f}" for name, value in scores.items()
+            if isinstance(value, numbers.Real) and not isinstance(value, bool)
+        )
+        key += f" | scores: {' '.join(buckets)}"
+    return key
+
+
+class SemanticCache:
+    """Embedding-similarity cache (cosine over normalized MiniLM embeddings)
+
+    Entries expire after ttl seconds, like the exact tier, so a similar
+    prompt never keeps returning an LLM result older than LLM_CACHE_TTL.
+    """
+
+    def __init__(self, threshold: float = SEMANTIC_DEFAULT_THRESHOLD, ttl: int = DEFAULT_TTL,
+                 maxsize: int = DEFAULT_MAXSIZE, model_name: str = SEMANTIC_MODEL_NAME):
+        self.enabled = faiss is not None and SentenceTransformer is not None
+        self.threshold = threshold
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self.model_name = model_name
+        self.stats = {'hits': 0, 'misses': 0}
+        self._model = None
+        self._indexes = {}  # fn name -> (IndexFlatIP, [(inserted_at, vector, result)])
+        self._lock = threading.Lock()
+
+    def set_threshold(self, threshold: float) -> None:
+        """Change the threshold in this process only; other workers keep theirs"""
+        low, high = SEMANTIC_THRESHOLD_RANGE
+        if not low <= threshold <= high:
+            raise ValueError(f"Semantic threshold must be between {low} and {high}")
+        self.threshold = threshold
+
+    def get(self, fn_name: str, text: str) -> Tuple[Optional[Any], 'np.ndarray']:
+        """Look up the closest fresh entry; also returns the embedding for add()"""
+        vector = self._embed(text)
+        expired_before = time.monotonic() - self.ttl
+        with self._lock:
+            entry = self._indexes.get(fn_name)
+            if entry is not None and entry[0].ntotal:
+                index, items = entry
+                scores, ids = index.search(vector, min(index.ntotal, 8))
+                for score, idx in zip(scores[0], ids[0]):
+                    if score < self.threshold:
+                        break
+                    inserted_at, _, value = items[idx]
+                    if inserted_at >= expired_before:
+                        self.stats['hits'] += 1
+                        return value, vector
+            self.stats['misses'] += 1
+        return None, vector
+
+    def add(self, fn_name: str, vector: 'np.ndarray', value: Any) -> None:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._indexes.get(fn_name)
+            items = entry[1] if entry is not None else []
+            # IndexFlatIP cannot remove single vectors, so rebuild it without
+            # expired entries (and the oldest ones once full)
+            fresh = [item for item in items if item[0] >= now - self.ttl]
+            fresh = fresh[max(len(fresh) - self.maxsize + 1, 0):]
+            if entry is None or len(fresh) != len(items):
+                index = faiss.IndexFlatIP(vector.shape[1])
+                for _, item_vector, _ in fresh:
+                    index.add(item_vector)
+                entry = (index, fresh)
+                self._indexes[fn_name] = entry
+            entry[0].add(vector)
+            entry[1].append((now, vector, value))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._indexes = {}
+            self.stats = {'hits': 0, 'misses': 0}
+
+    def get_stats(self) -> Dict:
+        with self._lock:
+            return {
+                'enabled': self.enabled,
+                'model': self.model_name,
+                'threshold': self.threshold,
+                'ttl': self.ttl,
+                'hits': self.stats['hits'],
+                'misses': self.stats['misses'],
+                'size': sum(index.ntotal for index, _ in self._indexes.values())
+            }
+
+    def _embed(self, text: str) -> 'np.ndarray':
+        if self._model is None:
+            with self._lock:
+                if self._model is None:
+                    try:
+                        self._model = SentenceTransformer(self.model_name, device='cpu')
+                    except Exception:
+                        # e.g. the model download failed offline; don't retry on every request
+                        self.enabled = False
+                        raise
+        vector = self._model.encode([text], normalize_embeddings=True)
+        return np.asarray(vector, dtype='float32')
+
+
+class LLMCache:
+    """Exact-match cache in front of llm_service calls"""
+
+    def __init__(self, backend: CacheBackend = None, ttl: int = DEFAULT_TTL,
+                 semantic: SemanticCache = None):
+        self.backend = backend or MemoryCacheBackend()
+        self.ttl = ttl
+        self.semantic = semantic if semantic is not None and semantic.enabled else None
+        self.stats = {'hits': 0, 'misses': 0}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(fn_name: str, payload: Any) -> str:
+        """Build a stable cache key from a function name and its payload"""
+        raw = json.dumps({'fn': fn_name, 'payload': payload}, sort_keys=True, default=str)
+        return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+    def get(self, key: str) -> Optional[Any]:
+        value = self.backend.get(key)
+        with self._lock:
+            self.stats['hits' if value is not None else 'misses'] += 1
+        return value
+
+    def set(self, key: str, value: Any, ttl: int = None) -> None:
+        self.backend.set(key, value, ttl=ttl or self.ttl)
+
+    def call(self, func: Callable, *args, semantic_text: str = None) -> Any:
+        """Return the cached result of func(*args), calling the LLM on a miss.
+
+        When semantic_text is given and the semantic tier is enabled, an
+        exact miss falls back to a similarity lookup before calling the LLM.
+        Errors in the semantic tier are treated as misses.
+        """
+        key = self.make_key(func.__name__, list(args))
+        cached = self.get(key)
+        if cached is not None:
+            return cached
+
+        # Semantic hits are not copied into the exact tier, so they can never
+        # outlive the TTL of the entry they came from
+        vector = None
+        if self.semantic is not None and self.semantic.enabled and semantic_text is not None:
+            try:
+                cached, vector = self.semantic.get(func.__name__, semantic_text)
+            except Exception as e:
+                print(f"Semantic cache lookup failed, calling the LLM: {e}")
+            if cached is not None:
+                return cached
+
+        result = func(*args)
+        if self._is_cacheable(result):
+            self.set(key, result)
+            if vector is not None:
+                try:
+                    self.semantic.add(func.__name__, vector, result)
+                except Exception as e:
+                    print(f"Semantic cache insert failed: {e}")
+        return result
+
+    def clear(self) -> None:
+        self.backend.clear()
+        if self.semantic is not None:
+            self.semantic.clear()
+        with self._lock:
+            self.stats = {'hits': 0, 'misses': 0}
+
+    def get_stats(self) -> Dict:
+        with self._lock:
+            hits, misses = self.stats['hits'], self.stats['misses']
+        lookups = hits + misses
+        return {
+            'backend': type(self.backend).__name__,
+            'hits': hits,
+            'misses': misses,
+            'hit_rate': round(hits / lookups * 100, 1) if lookups else 0,
+            'size': len(self.backend) if hasattr(self.backend, '__len__') else None,
+            'ttl': self.ttl,
+            'semantic': self.semantic.get_stats() if self.semantic is not None else {'enabled': False}
+        }
+
+    @staticmethod
+    def _is_cacheable(result: Any) -> bool:
+        """Never cache empty or failed LLM responses"""
+        if result is None:
+            return False
+        if isinstance(result, dict) and result.get('success') is False:
+            return False
+        return True
+
+
+def create_llm_cache() -> LLMCache:
+    """Build the LLM cache from environment settings"""
+    ttl = int(os.getenv('LLM_CACHE_TTL', DEFAULT_TTL))
+    redis_url = os.getenv('LLM_CACHE_REDIS_URL')
+
+    if redis_url:
+        backend = RedisCacheBackend(redis_url)
+    else:
+        backend = MemoryCacheBackend(maxsize=int(os.getenv('LLM_CACHE_MAXSIZE', DEFAULT_MAXSIZE)))
+
+    semantic = None
+    # Opt-in: every worker process loads its own copy of the embedding model
+    if os.getenv('LLM_SEMANTIC_CACHE', 'False').lower() == 'true':
+        semantic = SemanticCache(
+            threshold=float(os.getenv('LLM_SEMANTIC_CACHE_THRESHOLD', SEMANTIC_DEFAULT_THRESHOLD)),
+            ttl=ttl
+        )
+
+    return LLMCache(backend=backend, ttl=ttl, semantic=semantic)
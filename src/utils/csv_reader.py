@@ -0,0 +1,23 @@
+"""
+CSV parsing for uploaded files
+"""
+import pandas as pd
+
+try:
+    import pyarrow
+except ImportError:  # CSV uploads fall back to the pandas C parser
+    pyarrow = None
+
+
+def read_csv(stream, arrow_dtypes=False):
+    """Parse an uploaded CSV, with the multi-threaded pyarrow parser when available"""
+    if pyarrow is not None:
+        options = {'dtype_backend': 'pyarrow'} if arrow_dtypes else {}
+        try:
+            return pd.read_csv(stream, engine='pyarrow', **options)
+        except ValueError as e:
+            # pyarrow rejects ragged rows and duplicate headers; the C parser
+            # reads them as nulls and suffixed names, which the analyzer expects
+            print(f"pyarrow CSV parse failed, retrying with the C parser: {e}")
+            stream.seek(0)
+    return pd.read_csv(stream)
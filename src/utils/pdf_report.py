@@ -0,0 +1,162 @@
+"""
+PDF report builder for DQ Dashboard analysis exports
+"""
+from io import BytesIO
+from collections import ChainMap
+from datetime import datetime
+
+from reportlab.lib.pagesizes import letter
+from reportlab.lib import colors
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.lib.units import inch
+from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
+from reportlab.lib.enums import TA_CENTER
+
+
+# Styles are immutable configuration, so build them once per process
+_STYLES = getSampleStyleSheet()
+_TITLE_STYLE = ParagraphStyle(
+    'CustomTitle',
+    parent=_STYLES['Heading1'],
+    fontSize=24,
+    textColor=colors.HexColor('#6366f1'),
+    spaceAfter=6,
+    alignment=TA_CENTER,
+    fontName='Helvetica-Bold'
+)
+_HEADING_STYLE = ParagraphStyle(
+    'CustomHeading',
+    parent=_STYLES['Heading2'],
+    fontSize=14,
+    textColor=colors.HexColor('#1e293b'),
+    spaceAfter=12,
+    spaceBefore=12,
+    fontName='Helvetica-Bold'
+)
+
+_SCORES_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#6366f1')),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 12),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+    ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
+    ('GRID', (0, 0), (-1, -1), 1, colors.black),
+    ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+    ('FONTSIZE', (0, 1), (-1, -1), 10),
+    ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f0f0f0')])
+])
+_FIELD_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#6366f1')),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 10),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 8),
+    ('GRID', (0, 0), (-1, -1), 1, colors.black),
+    ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+    ('FONTSIZE', (0, 1), (-1, -1), 9),
+    ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f8f8f8')])
+])
+_ISSUES_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#ef4444')),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 10),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 8),
+    ('GRID', (0, 0), (-1, -1), 1, colors.black),
+    ('FONTNAME', (0, 1), (-1, -1), 'Helvetica'),
+    ('FONTSIZE', (0, 1), (-1, -1), 9),
+    ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#fff5f5')])
+])
+
+# Table headers and the defaults used for missing keys in each row
+_FIELD_HEADER = ('Field Name', 'Data Type', 'Completeness', 'Correctness', 'Overall Score', 'Grade')
+_FIELD_DEFAULTS = {
+    'field_name': '', 'data_type': '', 'completeness_score': 0,
+    'correctness_score': 0, 'overall_score': 0, 'quality_grade': ''
+}
+_ISSUES_HEADER = ('Type', 'Severity', 'Description', 'Field')
+_ISSUE_DEFAULTS = {'type': '', 'severity': '', 'description': '', 'field': '-'}
+
+
+def build_pdf_bytes(analysis: dict, entity_name: str) -> bytes:
+    """Render an analysis result as a PDF report.
+
+    Kept free of Flask and database state so it can run in a worker process.
+    """
+    # Create PDF
+    buffer = BytesIO()
+    doc = SimpleDocTemplate(buffer, pagesize=letter, topMargin=0.5*inch, bottomMargin=0.5*inch)
+    elements = []
+    
+    # Title
+    elements.append(Paragraph(entity_name, _TITLE_STYLE))
+    elements.append(Spacer(1, 0.2*inch))
+    
+    # Report Info
+    report_date = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    elements.append(Paragraph(f"<b>Report Generated:</b> {report_date}", _STYLES['Normal']))
+    elements.append(Spacer(1, 0.2*inch))
+    
+    # Quality Scores Summary
+    elements.append(Paragraph("Quality Scores", _HEADING_STYLE))
+    
+    table_scores = analysis.get('table_scores', {})
+    scores_data = [
+        ['Metric', 'Score', 'Status'],
+        ['Completeness', f"{table_scores.get('completeness_score', 0):.1f}%", '✓'],
+        ['Correctness', f"{table_scores.get('correctness_score', 0):.1f}%", '✓'],
+        ['Uniqueness', f"{table_scores.get('uniqueness_score', 0):.1f}%", '✓'],
+        ['Consistency', f"{table_scores.get('consistency_score', 0):.1f}%", '✓'],
+        ['Overall Score', f"{table_scores.get('overall_score', 0):.1f}%", table_scores.get('quality_grade', 'N/A')]
+    ]
+    
+    scores_table = Table(scores_data, colWidths=[2.5*inch, 2*inch, 1.5*inch])
+    scores_table.setStyle(_SCORES_TABLE_STYLE)
+    
+    elements.append(scores_table)
+    elements.append(Spacer(1, 0.3*inch))
+    
+    # Field Analysis
+    elements.append(Paragraph("Field-Level Analysis", _HEADING_STYLE))
+    
+    field_analyses = analysis.get('field_analyses', [])
+    if field_analyses:
+        fields = (ChainMap(field, _FIELD_DEFAULTS) for field in field_analyses)
+        field_data = [list(_FIELD_HEADER)] + [
+            [
+                f['field_name'],
+                f['data_type'],
+                f"{f['completeness_score']:.1f}%",
+                f"{f['correctness_score']:.1f}%",
+                f"{f['overall_score']:.1f}%",
+                f['quality_grade']
+            ]
+            for f in fields
+        ]
+    
+        field_table = Table(field_data, colWidths=[1.5*inch, 1*inch, 1*inch, 1*inch, 1*inch, 0.8*inch])
+        field_table.setStyle(_FIELD_TABLE_STYLE)
+        elements.append(field_table)
+        elements.append(Spacer(1, 0.3*inch))
+    
+    # Issues Section
+    issues = analysis.get('issues', [])
+    if issues:
+        elements.append(Paragraph("Detected Issues", _HEADING_STYLE))
+        issue_rows = (ChainMap(issue, _ISSUE_DEFAULTS) for issue in issues)
+        issues_data = [list(_ISSUES_HEADER)] + [
+            [i['type'], i['severity'], i['description'][:50], i['field']]
+            for i in issue_rows
+        ]
+    
+        issues_table = Table(issues_data, colWidths=[1*inch, 1*inch, 3*inch, 1.5*inch])
+        issues_table.setStyle(_ISSUES_TABLE_STYLE)
+        elements.append(issues_table)
+    
+    # Build PDF
+    doc.build(elements)
+    return buffer.getvalue()
@@ -0,0 +1,28 @@
+"""
+Tests for uploaded CSV parsing
+"""
+from io import BytesIO
+
+from src.utils.csv_reader import read_csv
+
+
+def test_ragged_rows_read_as_nulls():
+    df = read_csv(BytesIO(b'id,name,email\n1,Al,a@x\n2,Bo\n'))
+
+    assert list(df.columns) == ['id', 'name', 'email']
+    assert len(df) == 2
+    assert df['email'].isna().tolist() == [False, True]
+
+
+def test_duplicate_headers_are_suffixed():
+    df = read_csv(BytesIO(b'id,id\n1,2\n3,4\n'))
+
+    assert list(df.columns) == ['id', 'id.1']
+    assert df['id.1'].tolist() == [2, 4]
+
+
+def test_arrow_dtypes_fallback_still_parses():
+    df = read_csv(BytesIO(b'id,name\n1,Al\n2\n'), arrow_dtypes=True)
+
+    assert len(df) == 2
+    assert df['name'].isna().tolist() == [False, True]
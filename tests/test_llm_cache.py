@@ -0,0 +1,182 @@
+"""
+Tests for the LLM response cache
+"""
+import pytest
+
+from src.services import llm_cache
+from src.services.llm_cache import LLMCache, MemoryCacheBackend, semantic_key
+
+
+class FakeClock:
+    """Stands in for time.monotonic so expiry can be tested without sleeping"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeSemanticCache:
+    """Semantic tier that always matches once something has been added"""
+
+    enabled = True
+
+    def __init__(self):
+        self.value = None
+
+    def get(self, fn_name, text):
+        return self.value, 'vector'
+
+    def add(self, fn_name, vector, value):
+        self.value = value
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(llm_cache.time, 'monotonic', fake)
+    return fake
+
+
+def make_llm(results):
+    """Fake llm_service method returning the given results in order"""
+    calls = []
+
+    def analyze_table_quality(*args):
+        calls.append(args)
+        return results[len(calls) - 1]
+
+    return analyze_table_quality, calls
+
+
+def test_memory_backend_expires_entries(clock):
+    backend = MemoryCacheBackend()
+    backend.set('key', {'insight': 'ok'}, ttl=10)
+
+    clock.now += 9
+    assert backend.get('key') == {'insight': 'ok'}
+
+    clock.now += 2
+    assert backend.get('key') is None
+    assert len(backend) == 0
+
+
+def test_memory_backend_evicts_least_recently_used():
+    backend = MemoryCacheBackend(maxsize=2)
+    backend.set('a', 1)
+    backend.set('b', 2)
+    backend.get('a')
+    backend.set('c', 3)
+
+    assert backend.get('a') == 1
+    assert backend.get('b') is None
+    assert backend.get('c') == 3
+
+
+def test_make_key_is_stable_across_dict_order():
+    first = LLMCache.make_key('fn', [{'table_name': 't', 'issues': [1, 2]}])
+    second = LLMCache.make_key('fn', [{'issues': [1, 2], 'table_name': 't'}])
+
+    assert first == second
+    assert first != LLMCache.make_key('other_fn', [{'table_name': 't', 'issues': [1, 2]}])
+    assert first != LLMCache.make_key('fn', [{'table_name': 't', 'issues': [2, 1]}])
+
+
+def test_call_hits_cache_for_identical_arguments():
+    cache = LLMCache()
+    llm, calls = make_llm([{'success': True, 'insight': 'first'}])
+
+    assert cache.call(llm, {'table_name': 't'}) == {'success': True, 'insight': 'first'}
+    assert cache.call(llm, {'table_name': 't'}) == {'success': True, 'insight': 'first'}
+
+    assert len(calls) == 1
+    stats = cache.get_stats()
+    assert (stats['hits'], stats['misses'], stats['hit_rate']) == (1, 1, 50.0)
+
+
+def test_call_misses_for_different_arguments():
+    cache = LLMCache()
+    llm, calls = make_llm(['HR', 'Finance'])
+
+    assert cache.call(llm, ['emp_id'], 'a.csv') == 'HR'
+    assert cache.call(llm, ['invoice_id'], 'b.csv') == 'Finance'
+    assert len(calls) == 2
+
+
+@pytest.mark.parametrize('result', [None, {'success': False, 'error': 'timeout'}])
+def test_call_does_not_cache_failed_results(result):
+    cache = LLMCache()
+    llm, calls = make_llm([result, {'success': True}])
+
+    assert cache.call(llm, 'payload') == result
+    assert cache.call(llm, 'payload') == {'success': True}
+    assert len(calls) == 2
+
+
+def test_call_refreshes_after_ttl(clock):
+    cache = LLMCache(ttl=60)
+    llm, calls = make_llm([{'insight': 'old'}, {'insight': 'new'}])
+
+    cache.call(llm, 'payload')
+    clock.now += 61
+
+    assert cache.call(llm, 'payload') == {'insight': 'new'}
+    assert len(calls) == 2
+
+
+def test_semantic_hit_is_not_copied_into_exact_tier():
+    semantic = FakeSemanticCache()
+    cache = LLMCache(semantic=semantic)
+    llm, calls = make_llm([{'insight': 'first'}, {'insight': 'second'}])
+
+    cache.call(llm, 'a', semantic_text='similar')
+    assert cache.call(llm, 'b', semantic_text='similar') == {'insight': 'first'}
+
+    # Once the semantic tier stops matching, 'b' must reach the LLM again
+    semantic.value = None
+    assert cache.call(llm, 'b', semantic_text='similar') == {'insight': 'second'}
+    assert len(calls) == 2
+
+
+def test_semantic_errors_fall_through_to_llm():
+    semantic = FakeSemanticCache()
+
+    def broken_get(fn_name, text):
+        raise RuntimeError('encode failed')
+
+    semantic.get = broken_get
+    cache = LLMCache(semantic=semantic)
+    llm, calls = make_llm([{'insight': 'first'}])
+
+    assert cache.call(llm, 'a', semantic_text='similar') == {'insight': 'first'}
+    assert len(calls) == 1
+    assert cache.call(llm, 'a', semantic_text='similar') == {'insight': 'first'}
+    assert len(calls) == 1
+
+
+def test_semantic_model_load_failure_disables_tier(monkeypatch):
+    loads = []
+
+    def failing_model(*args, **kwargs):
+        loads.append(args)
+        raise OSError('model download failed')
+
+    monkeypatch.setattr(llm_cache, 'faiss', object())
+    monkeypatch.setattr(llm_cache, 'SentenceTransformer', failing_model)
+    cache = LLMCache(semantic=llm_cache.SemanticCache())
+    llm, calls = make_llm([{'insight': 'first'}, {'insight': 'second'}])
+
+    assert cache.call(llm, 'a', semantic_text='similar') == {'insight': 'first'}
+    assert cache.call(llm, 'b', semantic_text='similar') == {'insight': 'second'}
+    assert len(calls) == 2
+    assert len(loads) == 1
+    assert cache.get_stats()['semantic']['enabled'] is False
+
+
+def test_semantic_key_separates_score_buckets():
+    issues = [{'type': 'missing', 'field': 'email'}]
+
+    before = semantic_key('employees', 'HR', issues, {'overall_score': 71.2})
+    assert before == semantic_key('employees', 'HR', issues, {'overall_score': 68.0})
+    assert before != semantic_key('employees', 'HR', issues, {'overall_score': 91.0})